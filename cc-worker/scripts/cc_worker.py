@@ -15,13 +15,34 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
+import hashlib
 import json
 import os
-import re
+import platform
+import queue
+import select
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are not locked
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 __version__ = "0.1.0"
 
@@ -54,14 +75,45 @@ DISALLOWED_TOOLS = [
     "NotebookEdit",
 ]
 
+# Seconds claude may stay silent on stdout before it is considered hung.
+# stream-json emits an event per message, so healthy runs reset this often.
+DEFAULT_IDLE_TIMEOUT = 300
+
+# Command-line forms of the constants above, built once per process.
+_WORKER_PROMPT_FILE_STR = str(WORKER_PROMPT_FILE)
+_DEFAULT_ALLOWED_TOOLS_ARG = ",".join(DEFAULT_ALLOWED_TOOLS)
+_DISALLOWED_TOOLS_ARG = ",".join(DISALLOWED_TOOLS)
+
+_IS_WINDOWS = platform.system() == "Windows"
+
+_CLAUDE_BIN_CANDIDATES = (
+    Path.home() / "AppData" / "Roaming" / "npm" / "claude.cmd",
+    Path.home() / ".claude" / "local" / "claude.exe",
+    Path.home() / ".claude" / "local" / "claude",
+    Path("/usr/local/bin/claude"),
+)
 
-def _find_claude_bin() -> str:
-    import shutil
-    import platform
 
-    is_windows = platform.system() == "Windows"
+def _json_loads(data: bytes | bytearray | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    if is_windows:
+
+def _json_dumps(data: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _find_claude_bin() -> str:
+    if _IS_WINDOWS:
         cmd_path = shutil.which("claude.cmd")
         if cmd_path:
             return cmd_path
@@ -70,40 +122,37 @@ def _find_claude_bin() -> str:
     if path:
         return path
 
-    candidates = [
-        Path.home() / "AppData" / "Roaming" / "npm" / "claude.cmd",
-        Path.home() / ".claude" / "local" / "claude.exe",
-        Path.home() / ".claude" / "local" / "claude",
-        Path("/usr/local/bin/claude"),
-    ]
-    for c in candidates:
+    for c in _CLAUDE_BIN_CANDIDATES:
         if c.exists():
             return str(c)
     return "claude"
 
 
 def _build_exec_cmd(
-    task: str,
+    task: str | None,
     *,
     model: str | None = None,
     max_turns: int = 15,
     allowed_tools: list[str] | None = None,
 ) -> list[str]:
-    tools = allowed_tools or DEFAULT_ALLOWED_TOOLS
+    tools = ",".join(allowed_tools) if allowed_tools else _DEFAULT_ALLOWED_TOOLS_ARG
+    # Without a task the prompt is read from stdin as stream-json frames.
+    prompt = [task] if task is not None else ["--input-format", "stream-json"]
     cmd = [
         _find_claude_bin(),
         "-p",
-        task,
+        *prompt,
         "--output-format",
-        "json",
+        "stream-json",
+        "--verbose",
         "--max-turns",
         str(max_turns),
         "--append-system-prompt-file",
-        str(WORKER_PROMPT_FILE),
+        _WORKER_PROMPT_FILE_STR,
         "--allowedTools",
-        ",".join(tools),
+        tools,
         "--disallowedTools",
-        ",".join(DISALLOWED_TOOLS),
+        _DISALLOWED_TOOLS_ARG,
     ]
     if model:
         cmd.extend(["--model", model])
@@ -124,11 +173,12 @@ def _build_continue_cmd(
         "--resume",
         session_id,
         "--output-format",
-        "json",
+        "stream-json",
+        "--verbose",
         "--max-turns",
         str(max_turns),
         "--disallowedTools",
-        ",".join(DISALLOWED_TOOLS),
+        _DISALLOWED_TOOLS_ARG,
     ]
     if model:
         cmd.extend(["--model", model])
@@ -142,75 +192,165 @@ def _clean_env() -> dict[str, str]:
 
 
 def _extract_worker_json(text: str) -> dict | None:
-    try:
-        data = json.loads(text)
-        if isinstance(data, dict) and "status" in data:
-            return data
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    pattern = r"```(?:json)?\s*\n(.*?)\n```"
-    matches = re.findall(pattern, text, re.DOTALL)
-    for match in matches:
+    # Most results are Markdown prose; only try a whole-text parse when it
+    # can actually be a bare object.
+    stripped = text.lstrip()
+    if stripped.startswith("{"):
         try:
-            data = json.loads(match)
+            data = _json_loads(stripped)
             if isinstance(data, dict) and "status" in data:
                 return data
+        except json.JSONDecodeError:
+            pass
+
+    return _scan_worker_object(text)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _scan_worker_object(text: str) -> dict | None:
+    """Return the first fenced JSON object in ``text`` that has a ``status``.
+
+    Walks the text once, jumping between ``` fences with ``str.find``. Only
+    untagged or ``json`` fences whose body opens with ``{`` are decoded, and
+    the decoder stops at the matching closing brace.
+    """
+    pos = 0
+    while True:
+        start = text.find("```", pos)
+        if start == -1:
+            return None
+        eol = text.find("\n", start + 3)
+        if eol == -1:
+            return None
+        body_end = text.find("\n```", eol)
+        pos = len(text) if body_end == -1 else body_end + 4
+
+        if text[start + 3 : eol].strip() not in ("", "json"):
+            continue
+        body = eol + 1
+        while body < len(text) and text[body].isspace():
+            body += 1
+        if not text.startswith("{", body):
+            continue
+        try:
+            data, _ = _JSON_DECODER.raw_decode(text, body)
         except json.JSONDecodeError:
             continue
+        if isinstance(data, dict) and "status" in data:
+            return data
+
 
-    return None
+def _strip_list_marker(line: str) -> str:
+    """Drop a leading ``1.``/``1)`` and then a ``-``/``*`` list marker."""
+    n = len(line)
+    i = 0
+    while i < n and line[i].isdecimal():
+        i += 1
+    if 0 < i < n and line[i] in ".)":
+        i += 1
+        while i < n and line[i].isspace():
+            i += 1
+    else:
+        i = 0
+    if i < n and line[i] in "-*":
+        i += 1
+        while i < n and line[i].isspace():
+            i += 1
+    return line[i:]
 
 
 def _fallback_extract_questions(text: str) -> list[str]:
     questions = []
     for line in text.splitlines():
         line = line.strip()
-        if len(line) < 10 or line.startswith("#"):
+        # A question must end with "?" and be longer than 10 chars once
+        # list markers are removed, so most lines are rejected up front.
+        if len(line) < 11 or line[0] == "#" or line[-1] != "?":
             continue
-        cleaned = re.sub(r"^[\d]+[.)]\s*", "", line)
-        cleaned = re.sub(r"^[-*]\s*", "", cleaned)
-        if cleaned.endswith("?") and len(cleaned) > 10:
+        cleaned = _strip_list_marker(line)
+        if len(cleaned) > 10:
             questions.append(cleaned)
     return questions
 
 
-def _run(cmd: list[str], cwd: str | None = None, timeout: int = 600) -> dict:
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            env=_clean_env(),
-            timeout=timeout,
-        )
-    except FileNotFoundError:
-        return {
-            "error": "claude CLI not found. Install Claude Code first.",
-            "exit_code": -1,
-        }
-    except subprocess.TimeoutExpired:
-        return {
-            "error": f"Task timed out after {timeout} seconds",
-            "exit_code": -2,
-        }
+class _EventStream:
+    """Incremental decoder for ``--output-format stream-json`` output.
+
+    Bytes are fed as they arrive from the pipe and every complete line that
+    decodes to a JSON object is returned as an event, so callers can react
+    before the process exits. Lines are decoded straight from bytes. The raw
+    output is only retained until the first stream event arrives, as it is
+    only needed when the CLI printed a single JSON document instead.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[bytes] = []
+        self.head = b""
+        self.raw: bytearray | None = bytearray()
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        if len(self.head) < 2000:
+            self.head += chunk[: 2000 - len(self.head)]
+        if self.raw is not None:
+            self.raw += chunk
+        if b"\n" not in chunk:
+            self._pending.append(chunk)
+            return []
+        self._pending.append(chunk)
+        lines = b"".join(self._pending).split(b"\n")
+        self._pending = [lines.pop()]
+        return self._decode(lines)
+
+    def close(self) -> list[dict]:
+        lines = [b"".join(self._pending)]
+        self._pending = []
+        return self._decode(lines)
+
+    def _decode(self, lines: list[bytes]) -> list[dict]:
+        events = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict):
+                events.append(event)
+                if "type" in event:
+                    self.raw = None
+        return events
+
+
+def _assistant_text(event: dict) -> str:
+    message = event.get("message") or {}
+    content = message.get("content") or []
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
 
-    if proc.returncode != 0 and not proc.stdout.strip():
-        return {
-            "error": proc.stderr.strip() or f"claude exited with code {proc.returncode}",
-            "exit_code": proc.returncode,
-        }
 
-    try:
-        raw = json.loads(proc.stdout)
-    except json.JSONDecodeError:
-        return {
-            "error": "Failed to parse claude output as JSON",
-            "raw_output": proc.stdout[:2000],
-            "exit_code": proc.returncode,
-        }
+def _progress_snapshot(session_id: str, num_turns: int, text: str) -> dict:
+    snapshot = {
+        "type": "progress",
+        "session_id": session_id,
+        "num_turns": num_turns,
+    }
+    worker_data = _extract_worker_json(text)
+    if worker_data:
+        snapshot["status"] = worker_data.get("status", "")
+        snapshot["summary"] = worker_data.get("summary", "")
+        snapshot["questions"] = worker_data.get("questions", [])
+    return snapshot
 
+
+def _parse_result(raw: dict) -> dict:
     result = {
         "session_id": raw.get("session_id", ""),
         "model": raw.get("model", ""),
@@ -246,22 +386,324 @@ def _run(cmd: list[str], cwd: str | None = None, timeout: int = 600) -> dict:
     return result
 
 
+def _spawn(
+    cmd: list[str], cwd: str | None = None, *, stdin: int | None = None
+) -> subprocess.Popen:
+    return subprocess.Popen(
+        cmd,
+        stdin=stdin,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,
+        cwd=cwd,
+        env=_clean_env(),
+    )
+
+
+def _run(
+    cmd: list[str],
+    cwd: str | None = None,
+    timeout: int | None = None,
+    on_progress: Callable[[dict], None] | None = None,
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+) -> dict:
+    try:
+        proc = _spawn(cmd, cwd)
+    except FileNotFoundError:
+        return {
+            "error": "claude CLI not found. Install Claude Code first.",
+            "exit_code": -1,
+        }
+    return _collect(proc, timeout, on_progress, idle_timeout)
+
+
+def _collect(
+    proc: subprocess.Popen,
+    timeout: int | None,
+    on_progress: Callable[[dict], None] | None = None,
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+) -> dict:
+    """Read a claude process to completion.
+
+    The process is killed when stdout stays silent for ``idle_timeout``
+    seconds, or when ``timeout`` seconds have passed in total (if given).
+    """
+    # stderr is drained on the side so a chatty CLI can't fill the pipe and
+    # stall the stdout loop below.
+    stderr_chunks: list[bytes] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+    timed_out = threading.Event()
+    stalled = threading.Event()
+
+    def _kill(flag: threading.Event) -> None:
+        flag.set()
+        proc.kill()
+
+    deadline = time.monotonic() + timeout if timeout else None
+    timer = watchdog = None
+    if _IS_WINDOWS and timeout:
+        timer = threading.Timer(timeout, _kill, (timed_out,))
+        timer.start()
+
+    stream = _EventStream()
+    init: dict = {}
+    final: dict | None = None
+    num_turns = 0
+    last_fields: tuple | None = None
+    try:
+        while True:
+            if _IS_WINDOWS:
+                # select() can't wait on pipes here; re-arm a kill timer.
+                watchdog = threading.Timer(idle_timeout, _kill, (stalled,))
+                watchdog.start()
+            else:
+                wait = idle_timeout
+                if deadline is not None:
+                    wait = min(wait, max(deadline - time.monotonic(), 0))
+                if not select.select([proc.stdout], [], [], wait)[0]:
+                    # Stop reading right away: a killed CLI's own children
+                    # may still hold the pipe open.
+                    expired = deadline is not None and time.monotonic() >= deadline
+                    _kill(timed_out if expired else stalled)
+                    break
+            chunk = proc.stdout.read(65536)
+            if watchdog:
+                watchdog.cancel()
+            if not chunk:
+                events = stream.close()
+            else:
+                events = stream.feed(chunk)
+            for event in events:
+                kind = event.get("type")
+                if kind == "system" and event.get("subtype") == "init":
+                    init = event
+                elif kind == "assistant":
+                    num_turns += 1
+                    text = _assistant_text(event)
+                    if on_progress and text:
+                        snapshot = _progress_snapshot(
+                            event.get("session_id") or init.get("session_id", ""),
+                            num_turns,
+                            text,
+                        )
+                        # num_turns grows on every event; only report when
+                        # the worker's own fields change.
+                        fields = (
+                            snapshot.get("status"),
+                            snapshot.get("summary"),
+                            snapshot.get("questions"),
+                        )
+                        if fields != last_fields:
+                            last_fields = fields
+                            on_progress(snapshot)
+                elif kind == "result":
+                    final = event
+            if not chunk:
+                break
+        proc.wait()
+    finally:
+        if timer:
+            timer.cancel()
+        if watchdog:
+            watchdog.cancel()
+        stderr_reader.join(timeout=5)
+        proc.stdout.close()
+        if not stderr_reader.is_alive():
+            proc.stderr.close()
+
+    # A process that already delivered its result but hangs on exit is not
+    # treated as a failure.
+    if timed_out.is_set() and final is None:
+        return {
+            "error": f"Task timed out after {timeout} seconds",
+            "exit_code": -2,
+        }
+    if stalled.is_set() and final is None:
+        return {
+            "error": f"No output from claude for {idle_timeout} seconds",
+            "exit_code": -2,
+        }
+
+    if proc.returncode != 0 and not stream.head.strip():
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+        return {
+            "error": stderr.strip() or f"claude exited with code {proc.returncode}",
+            "exit_code": proc.returncode,
+        }
+
+    if final is None:
+        # No result event seen: the CLI may have printed a single JSON
+        # document instead of an event stream.
+        try:
+            final = _json_loads(stream.raw) if stream.raw else None
+        except json.JSONDecodeError:
+            final = None
+        if not isinstance(final, dict):
+            return {
+                "error": "Failed to parse claude output as JSON",
+                "raw_output": stream.head.decode("utf-8", errors="replace"),
+                "exit_code": proc.returncode,
+            }
+
+    raw = dict(final)
+    raw.setdefault("model", init.get("model", ""))
+    return _parse_result(raw)
+
+
+class WorkerPool:
+    """Claude processes started ahead of time for ``exec_task``.
+
+    Each process is spawned with ``--input-format stream-json`` and blocks on
+    stdin, so Node.js startup overlaps with whatever the caller does between
+    tasks. A process serves exactly one task, keeping tasks in separate
+    sessions, and is replaced as soon as it is taken. When a warm process is
+    not usable (e.g. the CLI has no streaming input) the task falls back to a
+    one-shot ``claude -p`` run.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        cwd: str | None = None,
+        model: str | None = None,
+        max_turns: int = 15,
+        allowed_tools: list[str] | None = None,
+    ) -> None:
+        self.cwd = cwd
+        self._exec_args = {
+            "model": model,
+            "max_turns": max_turns,
+            "allowed_tools": allowed_tools,
+        }
+        self._idle: queue.Queue[subprocess.Popen] = queue.Queue()
+        self._streaming = True
+        for _ in range(size):
+            self._refill()
+
+    def __enter__(self) -> WorkerPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _refill(self) -> None:
+        if not self._streaming:
+            return
+        try:
+            proc = _spawn(
+                _build_exec_cmd(None, **self._exec_args),
+                self.cwd,
+                stdin=subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            self._streaming = False
+            return
+        self._idle.put(proc)
+
+    def _acquire(self) -> subprocess.Popen | None:
+        while True:
+            try:
+                proc = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if proc.poll() is None:
+                return proc
+            # Exited before receiving any input: streaming mode is unavailable.
+            self._streaming = False
+            self._discard(proc)
+
+    @staticmethod
+    def _discard(proc: subprocess.Popen) -> None:
+        for pipe in (proc.stdin, proc.stdout, proc.stderr):
+            if pipe:
+                pipe.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def run(
+        self,
+        task: str,
+        *,
+        timeout: int | None = None,
+        on_progress: Callable[[dict], None] | None = None,
+        idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
+    ) -> dict:
+        proc = self._acquire()
+        self._refill()
+        if proc is not None:
+            frame = {"type": "user", "message": {"role": "user", "content": task}}
+            try:
+                proc.stdin.write(_json_dumps(frame) + b"\n")
+                proc.stdin.close()
+            except OSError:
+                self._discard(proc)
+            else:
+                return _collect(proc, timeout, on_progress, idle_timeout)
+        cmd = _build_exec_cmd(task, **self._exec_args)
+        return _run(
+            cmd,
+            cwd=self.cwd,
+            timeout=timeout,
+            on_progress=on_progress,
+            idle_timeout=idle_timeout,
+        )
+
+    def close(self) -> None:
+        self._streaming = False
+        while True:
+            try:
+                proc = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(proc)
+
+
 def exec_task(
     task: str,
     *,
     cwd: str | None = None,
     model: str | None = None,
-    max_turns: int = 15,
+    max_turns: int | None = None,
     allowed_tools: list[str] | None = None,
-    timeout: int = 600,
+    timeout: int | None = None,
+    on_progress: Callable[[dict], None] | None = None,
+    pool: WorkerPool | None = None,
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
 ) -> dict:
+    if pool is not None:
+        # A pool's processes are already bound to its cwd/model/tools.
+        if (
+            cwd is not None
+            or model is not None
+            or allowed_tools is not None
+            or max_turns is not None
+        ):
+            raise ValueError(
+                "cwd, model, max_turns and allowed_tools are fixed by the pool"
+            )
+        return pool.run(
+            task, timeout=timeout, on_progress=on_progress, idle_timeout=idle_timeout
+        )
     cmd = _build_exec_cmd(
         task,
         model=model,
-        max_turns=max_turns,
+        max_turns=15 if max_turns is None else max_turns,
         allowed_tools=allowed_tools,
     )
-    return _run(cmd, cwd=cwd, timeout=timeout)
+    return _run(
+        cmd,
+        cwd=cwd,
+        timeout=timeout,
+        on_progress=on_progress,
+        idle_timeout=idle_timeout,
+    )
 
 
 def continue_session(
@@ -271,7 +713,9 @@ def continue_session(
     cwd: str | None = None,
     model: str | None = None,
     max_turns: int = 15,
-    timeout: int = 600,
+    timeout: int | None = None,
+    on_progress: Callable[[dict], None] | None = None,
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT,
 ) -> dict:
     cmd = _build_continue_cmd(
         session_id,
@@ -279,7 +723,13 @@ def continue_session(
         model=model,
         max_turns=max_turns,
     )
-    return _run(cmd, cwd=cwd, timeout=timeout)
+    return _run(
+        cmd,
+        cwd=cwd,
+        timeout=timeout,
+        on_progress=on_progress,
+        idle_timeout=idle_timeout,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -287,14 +737,190 @@ def continue_session(
 # ---------------------------------------------------------------------------
 
 
+# Summary fields of every session keyed by session_id, so listing needs a
+# single read. It is a cache: missing or unreadable means rebuild from files.
+_SESSION_INDEX = SESSION_DIR / "index.json"
+_SESSION_INDEX_LOCK = SESSION_DIR / "index.lock"
+
+
 def _ensure_session_dir() -> None:
     SESSION_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def _session_path(session_id: str) -> Path:
+    return SESSION_DIR / f"{session_id}.jsonl"
+
+
+def _legacy_session_path(session_id: str) -> Path:
     return SESSION_DIR / f"{session_id}.json"
 
 
+def _is_session_file(name: str) -> bool:
+    if name.endswith(".jsonl"):
+        return True
+    return name.endswith(".json") and name != _SESSION_INDEX.name
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _read_index() -> dict[str, dict] | None:
+    try:
+        index = _json_loads(_SESSION_INDEX.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return index if isinstance(index, dict) else None
+
+
+@contextmanager
+def _locked_index() -> Iterator[dict[str, dict]]:
+    """Yield the index for modification and write it back atomically."""
+    _ensure_session_dir()
+    with open(_SESSION_INDEX_LOCK, "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        index = _read_index()
+        if index is None:
+            index = _scan_sessions()
+        yield index
+        # Keys are kept sorted so prefix lookups can bisect them.
+        _write_atomic(_SESSION_INDEX, _json_dumps(dict(sorted(index.items()))))
+
+
+# A session is a JSON Lines log, <id>.jsonl. The first line is a header with
+# every summary field, space-padded to a multiple of _HEADER_BLOCK bytes so it
+# can be rewritten in place; each following line is one turn. A turn costs
+# one append plus one header rewrite, and listing reads only the header.
+# <id>.json files from older versions are still read and are converted on
+# their next update.
+_HEADER_BLOCK = 4096
+
+
+def _summarize(header: dict) -> dict:
+    return {
+        "session_id": header["session_id"],
+        "task": header["task"],
+        "cwd": header.get("cwd", ""),
+        "model": header.get("model", ""),
+        "created_at": header["created_at"],
+        "updated_at": header.get("updated_at", header["created_at"]),
+        "turns": header.get("turns_count", 0),
+        "last_status": header.get("last_status", ""),
+        "last_summary": header.get("last_summary", ""),
+    }
+
+
+def _assemble(header: dict, turns: list[dict]) -> dict:
+    summary = _summarize(header)
+    return {
+        "session_id": summary["session_id"],
+        "task": summary["task"],
+        "cwd": summary["cwd"],
+        "model": summary["model"],
+        "created_at": summary["created_at"],
+        "updated_at": summary["updated_at"],
+        "turns": turns,
+        "last_status": summary["last_status"],
+        "last_summary": summary["last_summary"],
+    }
+
+
+def _split_legacy(data: dict) -> tuple[dict, list[dict]]:
+    turns = data.get("turns", [])
+    header = {
+        "session_id": data["session_id"],
+        "task": data["task"],
+        "cwd": data.get("cwd", ""),
+        "model": data.get("model", ""),
+        "created_at": data["created_at"],
+        "updated_at": data.get("updated_at", data["created_at"]),
+        "last_status": data.get("last_status", ""),
+        "last_summary": data.get("last_summary", ""),
+        "turns_count": len(turns),
+    }
+    return header, turns
+
+
+def _new_turns(message: str, result: dict, now: str) -> list[dict]:
+    return [
+        {"role": "user", "content": message, "timestamp": now},
+        {
+            "role": "assistant",
+            "content": result.get("analysis", ""),
+            "status": result.get("status"),
+            "timestamp": now,
+        },
+    ]
+
+
+def _exchange_digest(message: str, result: dict) -> str:
+    parts = (
+        message,
+        result.get("status") or "",
+        result.get("summary") or "",
+        result.get("analysis") or "",
+    )
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _turn_lines(turns: list[dict]) -> bytes:
+    return b"".join(_json_dumps(turn) + b"\n" for turn in turns)
+
+
+def _encode_header(header: dict, size: int = 0) -> bytes:
+    """Encode ``header`` as one line padded to at least ``size`` bytes."""
+    line = _json_dumps(header)
+    blocks = -(-(len(line) + 1) // _HEADER_BLOCK)
+    size = max(size, blocks * _HEADER_BLOCK)
+    return line + b" " * (size - len(line) - 1) + b"\n"
+
+
+def _create_session_file(header: dict, turns: list[dict]) -> None:
+    _write_atomic(
+        _session_path(header["session_id"]),
+        _encode_header(header) + _turn_lines(turns),
+    )
+
+
+def _read_header(path: Path) -> tuple[dict, int]:
+    """Return the header of a session log and the bytes reserved for it."""
+    with path.open("rb") as f:
+        head = f.read(_HEADER_BLOCK)
+        if b"\n" not in head:
+            head += f.readline()
+    size = head.find(b"\n") + 1 or len(head)
+    return _json_loads(head[:size]), size
+
+
+def _write_header(path: Path, header: dict, size: int) -> None:
+    data = _encode_header(header, size)
+    if len(data) == size:
+        with path.open("r+b") as f:
+            f.write(data)
+        return
+    # Outgrew its reservation: move the turns behind a larger header.
+    with path.open("rb") as f:
+        f.seek(size)
+        rest = f.read()
+    _write_atomic(path, data + rest)
+
+
+def _read_log(path: Path) -> tuple[dict, list[dict]]:
+    with path.open("rb") as f:
+        header = _json_loads(f.readline())
+        turns = [_json_loads(line) for line in f if line.strip()]
+    return header, turns
+
+
+def _load_session(path: Path) -> dict:
+    if path.suffix == ".json":
+        return _json_loads(path.read_bytes())
+    return _assemble(*_read_log(path))
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -307,93 +933,158 @@ def session_save(
     model: str,
 ) -> dict:
     _ensure_session_dir()
-    data = {
+    now = _now_iso()
+    turns = _new_turns(task, result, now)
+    header = {
         "session_id": session_id,
         "task": task,
         "cwd": cwd,
         "model": model,
-        "created_at": _now_iso(),
-        "updated_at": _now_iso(),
-        "turns": [
-            {"role": "user", "content": task, "timestamp": _now_iso()},
-            {
-                "role": "assistant",
-                "content": result.get("result", ""),
-                "status": result.get("status"),
-                "timestamp": _now_iso(),
-            },
-        ],
+        "created_at": now,
+        "updated_at": now,
         "last_status": result.get("status", "completed"),
         "last_summary": result.get("summary", ""),
+        "turns_count": len(turns),
+        "last_digest": _exchange_digest(task, result),
     }
-    _session_path(session_id).write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
-    return data
+    _create_session_file(header, turns)
+    with _locked_index() as index:
+        index[session_id] = _summarize(header)
+    return _assemble(header, turns)
 
 
 def session_update(session_id: str, message: str, result: dict) -> dict:
+    """Append one exchange to a session and return its updated fields.
+
+    The result has the same fields as ``session_save``'s, except that the
+    turn log is not read back: ``turns`` is replaced by ``turns_count``.
+    """
     path = _session_path(session_id)
-    data = json.loads(path.read_text(encoding="utf-8"))
+    legacy = _legacy_session_path(session_id)
+    if not path.exists() and legacy.exists():
+        _create_session_file(*_split_legacy(_json_loads(legacy.read_bytes())))
+        legacy.unlink()
+
+    header, size = _read_header(path)
     now = _now_iso()
-    data["turns"].append({"role": "user", "content": message, "timestamp": now})
-    data["turns"].append(
-        {
-            "role": "assistant",
-            "content": result.get("result", ""),
-            "status": result.get("status"),
-            "timestamp": now,
-        }
-    )
-    data["updated_at"] = now
-    data["last_status"] = result.get("status", "completed")
-    data["last_summary"] = result.get("summary", "")
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    # A repeated exchange (e.g. a retried continue) is not logged twice.
+    digest = _exchange_digest(message, result)
+    if digest != header.get("last_digest"):
+        with path.open("ab") as f:
+            f.write(_turn_lines(_new_turns(message, result, now)))
+        header["turns_count"] = header.get("turns_count", 0) + 2
+    header["updated_at"] = now
+    header["last_status"] = result.get("status", "completed")
+    header["last_summary"] = result.get("summary", "")
+    header["last_digest"] = digest
+    _write_header(path, header, size)
+
+    with _locked_index() as index:
+        index[session_id] = _summarize(header)
+    data = _assemble(header, [])
+    del data["turns"]
+    data["turns_count"] = header["turns_count"]
     return data
 
 
-def session_list() -> list[dict]:
+def _load_session_summary(path: str) -> dict | None:
+    try:
+        if path.endswith(".json"):
+            header, _ = _split_legacy(_json_loads(Path(path).read_bytes()))
+        else:
+            header, _ = _read_header(Path(path))
+        return _summarize(header)
+    except (OSError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def _session_entries() -> list[os.DirEntry]:
+    """Session files in the directory, most recently written first."""
+    with os.scandir(SESSION_DIR) as it:
+        entries = [e for e in it if _is_session_file(e.name) and e.is_file()]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return entries
+
+
+def _load_summaries(paths: list[str]) -> list[dict]:
+    if not paths:
+        return []
+    # Reads are dominated by open/stat latency and release the GIL.
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        return [s for s in executor.map(_load_session_summary, paths) if s]
+
+
+def _scan_sessions() -> dict[str, dict]:
+    paths = [e.path for e in _session_entries()]
+    return {s["session_id"]: s for s in _load_summaries(paths)}
+
+
+def session_list(limit: int | None = None) -> list[dict]:
     _ensure_session_dir()
-    sessions = []
-    for path in SESSION_DIR.glob("*.json"):
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            sessions.append(
-                {
-                    "session_id": data["session_id"],
-                    "task": data["task"],
-                    "cwd": data.get("cwd", ""),
-                    "model": data.get("model", ""),
-                    "created_at": data["created_at"],
-                    "updated_at": data.get("updated_at", data["created_at"]),
-                    "turns": len(data.get("turns", [])),
-                    "last_status": data.get("last_status", ""),
-                    "last_summary": data.get("last_summary", ""),
-                }
-            )
-        except (json.JSONDecodeError, KeyError):
-            continue
+    index = _read_index()
+    if index is None and limit:
+        # Without an index, mtime ordering lets only the newest files be
+        # parsed; the index is rebuilt by the next full listing or write.
+        paths = [e.path for e in _session_entries()[:limit]]
+        sessions = _load_summaries(paths)
+    else:
+        if index is None:
+            with _locked_index() as index:
+                pass
+        sessions = list(index.values())
     sessions.sort(key=lambda s: s["updated_at"], reverse=True)
-    return sessions
+    return sessions[:limit] if limit else sessions
+
+
+def _match_prefix(keys: list[str], prefix: str) -> list[str]:
+    """Return the entries of sorted ``keys`` that start with ``prefix``."""
+    matches = []
+    for key in keys[bisect.bisect_left(keys, prefix) :]:
+        if not key.startswith(prefix):
+            break
+        matches.append(key)
+    return matches
+
+
+def _existing_session_paths(session_id: str) -> list[Path]:
+    # _is_session_file keeps index.json from being taken for a legacy session.
+    paths = (_session_path(session_id), _legacy_session_path(session_id))
+    return [p for p in paths if _is_session_file(p.name) and p.exists()]
 
 
 def session_get(session_id: str) -> dict | None:
+    """Load a session by full id or by a prefix matching exactly one session."""
     _ensure_session_dir()
-    path = _session_path(session_id)
-    if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
-    for p in SESSION_DIR.glob("*.json"):
-        if p.stem.startswith(session_id):
-            return json.loads(p.read_text(encoding="utf-8"))
-    return None
+    for path in _existing_session_paths(session_id):
+        return _load_session(path)
+
+    index = _read_index()
+    if index is not None:
+        matches = _match_prefix(list(index), session_id)
+        if len(matches) != 1:
+            return None
+        for path in _existing_session_paths(matches[0]):
+            return _load_session(path)
+        return None
+
+    paths = {
+        p.stem: p
+        for p in SESSION_DIR.iterdir()
+        if _is_session_file(p.name) and p.stem.startswith(session_id)
+    }
+    if len(paths) != 1:
+        return None
+    return _load_session(paths.popitem()[1])
 
 
 def session_delete(session_id: str) -> bool:
-    path = _session_path(session_id)
-    if path.exists():
+    paths = _existing_session_paths(session_id)
+    for path in paths:
         path.unlink()
-        return True
-    return False
+    # Also clears index entries whose file was removed by hand.
+    with _locked_index() as index:
+        indexed = index.pop(session_id, None) is not None
+    return bool(paths) or indexed
 
 
 # ---------------------------------------------------------------------------
@@ -405,6 +1096,10 @@ def _print_json(data: dict) -> None:
     print(json.dumps(data, indent=2, ensure_ascii=False))
 
 
+def _print_ndjson(data: dict) -> None:
+    print(json.dumps(data, ensure_ascii=False), flush=True)
+
+
 def _print_error(message: str) -> None:
     print(json.dumps({"error": message}, indent=2), file=sys.stderr)
 
@@ -420,10 +1115,12 @@ def cmd_exec(args: argparse.Namespace) -> int:
         model=args.model or None,
         max_turns=args.max_turns,
         allowed_tools=allowed_tools,
+        on_progress=_print_ndjson if args.stream else None,
     )
+    emit = _print_ndjson if args.stream else _print_json
 
     if "error" in result:
-        _print_json(result)
+        emit(result)
         return 1
 
     session_id = result.get("session_id", "")
@@ -436,7 +1133,7 @@ def cmd_exec(args: argparse.Namespace) -> int:
             model=result.get("model", args.model or ""),
         )
 
-    _print_json(result)
+    emit(result)
     return 0
 
 
@@ -455,23 +1152,23 @@ def cmd_continue(args: argparse.Namespace) -> int:
         cwd=cwd,
         model=args.model or None,
         max_turns=args.max_turns,
+        on_progress=_print_ndjson if args.stream else None,
     )
+    emit = _print_ndjson if args.stream else _print_json
 
     if "error" in result:
-        _print_json(result)
+        emit(result)
         return 1
 
     if session:
         session_update(full_id, args.message, result)
 
-    _print_json(result)
+    emit(result)
     return 0
 
 
 def cmd_sessions(args: argparse.Namespace) -> int:
-    sessions = session_list()
-    if args.limit:
-        sessions = sessions[: args.limit]
+    sessions = session_list(args.limit)
     _print_json({"sessions": sessions, "count": len(sessions)})
     return 0
 
@@ -511,6 +1208,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_exec.add_argument("--model", default=None, help="Model override")
     p_exec.add_argument("--max-turns", type=int, default=15, help="Max agentic turns (default: 15)")
     p_exec.add_argument("--allowed-tools", help="Comma-separated tool list override")
+    p_exec.add_argument("--stream", action="store_true", help="Emit NDJSON progress lines before the result")
     p_exec.set_defaults(func=cmd_exec)
 
     # continue
@@ -519,6 +1217,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_cont.add_argument("message", help="Follow-up message")
     p_cont.add_argument("--model", default=None, help="Model override")
     p_cont.add_argument("--max-turns", type=int, default=15, help="Max agentic turns (default: 15)")
+    p_cont.add_argument("--stream", action="store_true", help="Emit NDJSON progress lines before the result")
     p_cont.set_defaults(func=cmd_continue)
 
     # sessions